@@ -31,15 +31,45 @@ __all__ = [
 ]
 
 import os
+import typing
 
-if hasattr(os, "add_dll_directory"):
-    __scriptdir = os.path.dirname(os.path.realpath(__file__))
-    __dlldir = os.path.abspath(os.path.join(__scriptdir, "../../../lib"))
-    if os.path.exists(__dlldir):
-        with os.add_dll_directory(__dlldir):
-            from ._usdex_rtx import *  # noqa
-    else:
-        # fallback to requiring the client to setup the dll directory
-        from ._usdex_rtx import *  # noqa
-else:
+if typing.TYPE_CHECKING:
     from ._usdex_rtx import *  # noqa
+
+
+def __loadExtension():
+    # importing the extension loads the usdex_rtx library and all of its OpenUSD & MDL dependencies,
+    # so it is deferred until one of the public functions is first accessed
+    if hasattr(os, "add_dll_directory"):
+        scriptdir = os.path.dirname(os.path.realpath(__file__))
+        dlldir = os.path.abspath(os.path.join(scriptdir, "../../../lib"))
+        if os.path.exists(dlldir):
+            with os.add_dll_directory(dlldir):
+                from . import _usdex_rtx
+
+            return _usdex_rtx
+
+    # fallback to requiring the client to setup the dll directory
+    from . import _usdex_rtx
+
+    return _usdex_rtx
+
+
+def __cacheExtension():
+    # cache all public functions on the module so subsequent access bypasses __getattr__
+    extension = __loadExtension()
+    globals().update({x: getattr(extension, x) for x in dir(extension) if not x.startswith("_")})
+
+
+def __getattr__(name):
+    if not name.startswith("_"):
+        __cacheExtension()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    # introspection (e.g. autodoc) needs the full public API, so load the extension first
+    __cacheExtension()
+    return sorted(globals())
@@ -12,6 +12,7 @@ __all__ = [
     "TestCase",
 ]
 
+import functools
 import os
 import pathlib
 import re
@@ -21,8 +22,6 @@ import tempfile
 import unittest
 from typing import List, Optional
 
-import omni.asset_validator
-import pkg_resources
 import usdex.core
 from pxr import Sdf, Usd, UsdGeom
 
@@ -37,6 +36,8 @@ class TestCase(unittest.TestCase):
 
     validFileIdentifierRegex = r"[^A-Za-z0-9_-]"
 
+    _validFileIdentifierPattern = re.compile(validFileIdentifierRegex)
+
     defaultPrimName = "Root"
     "The default prim name to be used when configuring a ``Usd.Stage``"
 
@@ -62,9 +63,12 @@ class TestCase(unittest.TestCase):
     def setUp(self):
         super().setUp()
 
+        # omni.asset_validator is expensive to import, so defer it until a test actually runs
+        import omni.asset_validator
+
         self.validationEngine = omni.asset_validator.ValidationEngine(init_rules=True)
 
-    def assertIsValidUsd(self, asset: omni.asset_validator.AssetType, issuePredicates: Optional[List] = None, msg: Optional[str] = None):
+    def assertIsValidUsd(self, asset: "omni.asset_validator.AssetType", issuePredicates: Optional[List] = None, msg: Optional[str] = None):
         """Assert that given asset passes all enabled validation rules
 
         Args:
@@ -86,23 +90,26 @@ class TestCase(unittest.TestCase):
                 msg = "\n".join(str(issue) for issue in list(issues))
             self.fail(msg=msg)
 
-    def assertIsInvalidUsd(self, asset: omni.asset_validator.AssetType, issuePredicates: omni.asset_validator.IssuePredicates):
+    def assertIsInvalidUsd(self, asset: "omni.asset_validator.AssetType", issuePredicates: "omni.asset_validator.IssuePredicates"):
         """Assert that given asset reported with issuePredicates
 
         Args:
             asset: The Asset to validate. Either a Usd.Stage object or a path to a USD Layer.
             issuePredicates (List): List of omni.asset_validator.IssuePredicates.
         """
-        issues = self.__validateUsd(asset=asset, engine=self.validationEngine)
+        import omni.asset_validator
 
-        nonDetectedPredicates = []
-        for predicate in issuePredicates:
-            if not issues.filter_by(predicate):
-                nonDetectedPredicates.append(predicate)
+        issues = self.__validateUsd(asset=asset, engine=self.validationEngine)
 
-        # Chain all predicates by "or" condition
+        # Chain all predicates by "or" condition and split the issues in a single pass
         predicate = omni.asset_validator.IssuePredicates.Or(*issuePredicates)
-        unexpectedIssues = set(issues) - set(issues.filter_by(predicate))
+        expectedIssues = []
+        unexpectedIssues = []
+        for issue in issues:
+            (expectedIssues if predicate(issue) else unexpectedIssues).append(issue)
+
+        # Any issue matching an individual predicate also matched the chained predicate, so only the expected issues need to be searched
+        nonDetectedPredicates = [x for x in issuePredicates if not any(x(issue) for issue in expectedIssues)]
 
         if not nonDetectedPredicates and not unexpectedIssues:
             return
@@ -122,11 +129,22 @@ class TestCase(unittest.TestCase):
         """Assert that the given layer uses the given encoding type"""
         self.assertEqual(self.getUsdEncoding(layer), encoding)
 
-    def assertSdfLayerIdentifier(self, layer, identifier):
-        """Assert that the given layer has the expected identifier"""
-        # Resolve paths to normalize casing and then make them into posix paths, this removes platform specific variations
-        expected = pathlib.Path(identifier).resolve().as_posix()
-        returned = pathlib.Path(layer.identifier).resolve().as_posix()
+    def assertSdfLayerIdentifier(self, layer, identifier, followSymlinks: bool = False):
+        """Assert that the given layer has the expected identifier
+
+        Args:
+            layer: The ``Sdf.Layer`` to check
+            identifier: The expected identifier
+            followSymlinks: Optionally resolve both paths on the filesystem, following any symlinks, before comparing them
+        """
+        if followSymlinks:
+            # Resolve paths to normalize casing and then make them into posix paths, this removes platform specific variations
+            expected = pathlib.Path(identifier).resolve().as_posix()
+            returned = pathlib.Path(layer.identifier).resolve().as_posix()
+        else:
+            # Normalize the path strings without touching the filesystem, then make them into posix paths
+            expected = self.__normalizePath(identifier)
+            returned = self.__normalizePath(layer.identifier)
         self.assertEqual(expected, returned)
 
     def assertAttributeHasAuthoredValue(self, attr: Usd.Attribute, time=Usd.TimeCode.Default()):
@@ -138,36 +156,40 @@ class TestCase(unittest.TestCase):
 
     def assertMatricesAlmostEqual(self, first, second, places=12):
         """Assert that all 16 values of a pair of 4x4 matrices are equal, to a specified number of decimal places"""
-        for row in range(4):
-            for col in range(4):
-                x = first[row][col]
-                y = second[row][col]
-                self.assertEqual(round(x - y, places), 0)
-        self.assertTrue(True)
+        # compare all elements in a single pass and report every mismatch at once
+        mismatches = [(row, col) for row in range(4) for col in range(4) if round(first[row][col] - second[row][col], places) != 0]
+        if mismatches:
+            self.fail(msg=f"{first} != {second} within {places} places at (row, col) {mismatches}")
 
     def assertVecAlmostEqual(self, first, second, places=12):
         """Assert that all elements of a Vec are equal, to a specified number of decimal places"""
         self.assertEqual(len(first), len(second))
-        for idx in range(len(first)):
-            self.assertAlmostEqual(first[idx], second[idx], places)
+        mismatches = [idx for idx in range(len(first)) if first[idx] != second[idx] and round(abs(first[idx] - second[idx]), places) != 0]
+        if mismatches:
+            self.fail(msg=f"{first} != {second} within {places} places at indices {mismatches}")
 
-    def tmpLayer(self, name: str = "", ext: str = "usda") -> Sdf.Layer:
+    def tmpLayer(self, name: str = "", ext: str = "usda", inMemory: bool = False) -> Sdf.Layer:
         """
-        Create a temporary Sdf.Layer on the local filesystem
+        Create a temporary Sdf.Layer, either on the local filesystem or as an anonymous in-memory layer
 
         Args:
             name: an optional identifier prefix. If not provided the test name will be used
             ext: an optional file extension (excluding ``.``) which must match a registered Sdf.FileFormatPlugin
+            inMemory: optionally create an anonymous layer rather than a file on disk. It can still be written to disk via ``Export`` if required.
 
         Returns:
             The ``Sdf.Layer`` object
         """
-        return Sdf.Layer.CreateNew(self.tmpFile(name=name, ext="usda"))
+        if inMemory:
+            return Sdf.Layer.CreateAnonymous(f"{name or self._testMethodName}.{ext}")
+        return Sdf.Layer.CreateNew(self.tmpFile(name=name, ext=ext))
 
     def tmpFile(self, name: str = "", ext: str = "") -> str:
         """
         Create a temporary file on the local filesystem
 
+        The file is created empty, so the path can be authored as an existing asset (e.g. a texture) without failing validation.
+
         Args:
             name: an optional filename prefix. If not provided the test name will be used
             ext: an optional file extension (excluding ``.``)
@@ -180,7 +202,7 @@ class TestCase(unittest.TestCase):
             os.makedirs(tempDir)
 
         # Sanitize name string
-        name = re.sub(TestCase.validFileIdentifierRegex, "_", name or self._testMethodName)
+        name = TestCase._validFileIdentifierPattern.sub("_", name or self._testMethodName)
         (handle, fileName) = tempfile.mkstemp(prefix=f"{os.path.join(tempDir, name)}_", suffix=f".{ext}")
         # closing the os handle immediately. we don't need this now that the file is known to be unique
         # and it interferes with some internal processes.
@@ -190,6 +212,9 @@ class TestCase(unittest.TestCase):
     @staticmethod
     def isUsdOlderThan(version: str):
         """Determine if the provided versions is older than the current USD runtime"""
+        # pkg_resources is slow to import and rarely needed, so defer it until first use
+        import pkg_resources
+
         return pkg_resources.parse_version(".".join([str(x) for x in Usd.GetVersion()])) < pkg_resources.parse_version(version)
 
     @staticmethod
@@ -198,35 +223,51 @@ class TestCase(unittest.TestCase):
         Returns:
             The filesystem path
         """
-        # Sanitize Version string
-        versionString = re.sub(TestCase.validFileIdentifierRegex, "_", usdex.core.version())
+        versionString = TestCase.__versionString()
 
         # Create all subdirs under $TEMP
         pidString = os.environ.get("CI_PIPELINE_IID", os.getpid())
         subdirsPrefix = os.path.join("usdex", f"{versionString}-{pidString}")
         return os.path.join(tempfile.tempdir, subdirsPrefix)
 
+    @staticmethod
+    @functools.cache
+    def __versionString() -> str:
+        """Get the sanitized usdex version string. This is constant for the lifetime of the process so it is only computed once."""
+        return TestCase._validFileIdentifierPattern.sub("_", usdex.core.version())
+
     @classmethod
     def tearDownClass(cls):
         shutil.rmtree(cls.tmpBaseDir(), ignore_errors=True)
 
+    @staticmethod
+    def __normalizePath(path: str) -> str:
+        """Normalize the casing, separators, and relative components of a path without any filesystem access"""
+        return pathlib.PurePath(os.path.normcase(os.path.abspath(path))).as_posix()
+
+    @staticmethod
+    @functools.cache
+    def __findFileFormat(formatId: str) -> Sdf.FileFormat:
+        """Find a registered Sdf.FileFormat. The registry does not change at runtime so each lookup is only performed once."""
+        return Sdf.FileFormat.FindById(formatId)
+
     @staticmethod
     def getUsdEncoding(layer: Sdf.Layer):
         """Get the extension of the encoding type used within an SdfLayer"""
         fileFormat = layer.GetFileFormat()
 
         # If the encoding is explicit usda return that extension
-        usdaFileFormat = Sdf.FileFormat.FindById("usda")
+        usdaFileFormat = TestCase.__findFileFormat("usda")
         if fileFormat == usdaFileFormat:
             return "usda"
 
         # If the encoding is explicit usdc return that extension
-        usdcFileFormat = Sdf.FileFormat.FindById("usdc")
+        usdcFileFormat = TestCase.__findFileFormat("usdc")
         if fileFormat == usdcFileFormat:
             return "usdc"
 
         # If the encoding is implicit check which of the explicit extensions can read the layer and return that type
-        usdFileFormat = Sdf.FileFormat.FindById("usd")
+        usdFileFormat = TestCase.__findFileFormat("usd")
         if fileFormat == usdFileFormat:
             return usdFileFormat.GetUnderlyingFormatForLayer(layer)
 
@@ -234,10 +275,10 @@ class TestCase(unittest.TestCase):
 
     @staticmethod
     def __validateUsd(
-        asset: omni.asset_validator.AssetType,
-        engine: omni.asset_validator.ValidationEngine,
+        asset: "omni.asset_validator.AssetType",
+        engine: "omni.asset_validator.ValidationEngine",
         issuePredicates: Optional[List] = None,
-    ) -> omni.asset_validator.IssuesList:
+    ) -> "omni.asset_validator.IssuesList":
         """Validate asset passes all enabled validation rules
 
         Args:
@@ -251,6 +292,8 @@ class TestCase(unittest.TestCase):
         Return:
             A list of USD asset Issues.
         """
+        import omni.asset_validator
+
         result = engine.validate(asset)
 
         issues = result.issues()
@@ -9,6 +9,7 @@
 # its affiliates is strictly prohibited.
 import contextlib
 import io
+import json
 import os
 import sys
 
@@ -17,6 +18,41 @@ import packmanapi
 REPO_ROOT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "../..")
 REPO_DEPS_FILE = os.path.join(REPO_ROOT, "deps/repo-deps.packman.xml")
 REPO_DEPS_OPTIONAL_FILE = os.path.join(REPO_ROOT, "deps/repo-deps-nv.packman.xml")
+REPO_DEPS_CACHE_FILE = os.path.join(REPO_ROOT, "_repo/repo-deps-cache.json")
+
+
+def __depsCacheKey():
+    return [os.path.getmtime(x) if os.path.exists(x) else 0 for x in (REPO_DEPS_FILE, REPO_DEPS_OPTIONAL_FILE)]
+
+
+def __readDepsCache(key):
+    try:
+        with open(REPO_DEPS_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # the cache is only valid if it is well formed, the deps files are unchanged, and the packages are still present on disk
+    if not isinstance(cache, dict) or cache.get("key") != key:
+        return None
+    deps = cache.get("deps")
+    if not isinstance(deps, dict) or not all(isinstance(x, str) and os.path.exists(x) for x in deps.values()):
+        return None
+
+    return deps
+
+
+def __writeDepsCache(key, deps):
+    os.makedirs(os.path.dirname(REPO_DEPS_CACHE_FILE), exist_ok=True)
+    tmpFile = f"{REPO_DEPS_CACHE_FILE}.{os.getpid()}"
+    try:
+        with open(tmpFile, "w") as f:
+            json.dump({"key": key, "deps": deps}, f)
+        os.replace(tmpFile, REPO_DEPS_CACHE_FILE)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmpFile)
+        raise
 
 
 def bootstrap():
@@ -24,15 +60,24 @@ def bootstrap():
     Bootstrap all omni.repo modules.
 
     Pull with packman from repo.packman.xml and add them all to python sys.path to enable importing.
+    The resolved paths are cached and reused until the packman xml files are modified.
     """
-    with contextlib.redirect_stdout(io.StringIO()):
-        deps = packmanapi.pull(REPO_DEPS_FILE)
-        with contextlib.suppress(packmanapi.PackmanErrorFileNotFound):
-            deps.update(packmanapi.pull(REPO_DEPS_OPTIONAL_FILE, remotes=["cloudfront"]))
+    # skip resolving the deps with packman if they are unchanged since the last bootstrap
+    key = __depsCacheKey()
+    deps = __readDepsCache(key)
+    if deps is None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            deps = packmanapi.pull(REPO_DEPS_FILE)
+            with contextlib.suppress(packmanapi.PackmanErrorFileNotFound):
+                deps.update(packmanapi.pull(REPO_DEPS_OPTIONAL_FILE, remotes=["cloudfront"]))
+        with contextlib.suppress(OSError):
+            __writeDepsCache(key, deps)
 
+    seen = set(sys.path)
     for dep_path in deps.values():
-        if dep_path not in sys.path:
+        if dep_path not in seen:
             sys.path.append(dep_path)
+            seen.add(dep_path)
 
 
 if __name__ == "__main__":